@@ -0,0 +1,16 @@
+import unittest
+
+from app.main import validate_bytes
+
+
+class BigIntIdTest(unittest.TestCase):
+    def test_21_digit_ids_stay_distinct(self):
+        # orjson would turn both ids into the same lossy float.
+        feed = b'[{"id": 123456789012345678901}, {"id": 123456789012345678902}]'
+        result = validate_bytes(feed, "", "utf-8")
+        id_issues = [i for i in result.issues if i.field == "id"]
+        self.assertEqual(id_issues, [])
+
+
+if __name__ == "__main__":
+    unittest.main()